@@ -6,6 +6,24 @@ Creates and configures the Flask application
 from flask import Flask
 from app.config import Config
 
+# Optional (not required for core functionality)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    from flask.json.provider import JSONProvider
+
+    class OrJSONProvider(JSONProvider):
+        """JSON provider backed by the C-accelerated orjson encoder"""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
 
 def create_app(config_class=Config):
     """
@@ -23,6 +41,11 @@ def create_app(config_class=Config):
     
     # Load configuration
     app.config.from_object(config_class)
+
+    # Use orjson for (de)serialization when available; simulation
+    # results are large nested dicts where the stdlib encoder dominates
+    if orjson is not None:
+        app.json = OrJSONProvider(app)
     
     # Register blueprints
     from app.routes.main import main_bp
@@ -50,5 +73,5 @@ def register_error_handlers(app):
     
     @app.errorhandler(Exception)
     def handle_exception(error):
-        app.logger.error(f"Unhandled exception: {str(error)}")
+        app.logger.error("Unhandled exception: %s", error)
         return {"error": str(error)}, 500
@@ -3,14 +3,27 @@ Autonomous System Node Model
 Represents an AS in the BGP network
 """
 
-from typing import Dict, List, Optional, Set, Tuple
+import logging
+import sys
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Set, Tuple
 from app.models.route import Route
 from app.models.policy import Policy
 
+logger = logging.getLogger(__name__)
+
+# Nodes without a configured policy share one empty Policy: it holds no
+# per-node state and nothing mutates a Policy after construction, so a
+# fresh allocation per node was pure overhead
+_DEFAULT_POLICY = Policy()
+
 
 class ASNode:
     """Autonomous System node"""
-    
+
+    __slots__ = ('asn', 'neighbors', 'neighbor_refs', 'rib', 'rib_in',
+                 '_advertisers', '_adv_cache', 'policy', 'dirty_prefixes')
+
     def __init__(self, asn: str, policy: Optional[Policy] = None):
         """
         Initialize AS node
@@ -19,12 +32,16 @@ class ASNode:
             asn: AS number
             policy: BGP policy (optional)
         """
-        self.asn = asn
+        self.asn = sys.intern(asn)
         self.neighbors: Set[str] = set()
+        self.neighbor_refs: List['ASNode'] = []  # direct refs, set by the simulator
         self.rib: Dict[str, Route] = {}  # Routing Information Base
-        self.rib_in: Dict[str, Dict[str, Route]] = {}  # Per-neighbor RIB-In
-        self.policy = policy or Policy()
-        print(f"Initialized AS{asn} node")
+        self.rib_in: Dict[Tuple[str, str], Route] = {}  # (neighbor, prefix) RIB-In
+        self._advertisers: Dict[str, Set[str]] = {}  # prefix -> neighbors advertising it
+        self._adv_cache: Dict[str, Optional[Route]] = {}  # prefix -> prepared route
+        self.policy = policy or _DEFAULT_POLICY
+        self.dirty_prefixes: Set[str] = set()  # prefixes whose best route changed since last advertised
+        logger.debug("Initialized AS%s node", asn)
     
     def add_neighbor(self, neighbor_asn: str):
         """
@@ -34,7 +51,6 @@ class ASNode:
             neighbor_asn: AS number of neighbor
         """
         self.neighbors.add(neighbor_asn)
-        self.rib_in[neighbor_asn] = {}
     
     def originate_route(self, prefix: str) -> Route:
         """
@@ -47,7 +63,8 @@ class ASNode:
             Originated route
         """
         from app.models.route import OriginType
-        
+
+        prefix = sys.intern(prefix)
         route = Route(
             prefix=prefix,
             as_path=[self.asn],
@@ -55,17 +72,18 @@ class ASNode:
             local_pref=100,
             next_hop=self.asn
         )
-        print(f"AS{self.asn} originating route for {prefix}")
+        logger.debug("AS%s originating route for %s", self.asn, prefix)
         
         # Store in RIB-In from self
-        if self.asn not in self.rib_in:
-            self.rib_in[self.asn] = {}
-        self.rib_in[self.asn][prefix] = route
+        self.rib_in[(self.asn, prefix)] = route
+        self._advertisers.setdefault(prefix, set()).add(self.asn)
         
         # Store in RIB and trigger decision process
         self.rib[prefix] = route
+        self._invalidate_adv_cache(prefix)
+        self.dirty_prefixes.add(prefix)
         self._run_decision_process(prefix)
-        print(f"AS{self.asn} RIB after origination: {self.rib}")
+        logger.debug("AS%s RIB after origination: %s", self.asn, self.rib)
         return route
     
     def receive_route(self, route: Route, from_asn: str) -> bool:
@@ -79,40 +97,42 @@ class ASNode:
         Returns:
             True if route was accepted and caused a change
         """
-        print(f"AS{self.asn} receiving route from AS{from_asn} for prefix {route.prefix}")
+        logger.debug("AS%s receiving route from AS%s for prefix %s", self.asn, from_asn, route.prefix)
         
         # Loop prevention
         if route.has_loop(self.asn):
-            print(f"AS{self.asn} detected loop in path {route.as_path}")
+            logger.debug("AS%s detected loop in path %s", self.asn, route.as_path)
             return False
         
         # Validate next_hop attribute
         if not route.next_hop:
-            print(f"AS{self.asn} received route with no next_hop")
+            logger.debug("AS%s received route with no next_hop", self.asn)
             return False
             
         # Apply import policy
         imported_route = self.policy.apply_import(route, from_asn)
         if not imported_route:
-            print(f"AS{self.asn} route filtered by import policy")
+            logger.debug("AS%s route filtered by import policy", self.asn)
             return False
         
-        # Create a new copy for modification
-        imported_route = imported_route.clone()
-        
-        # Store in RIB-In with validated next_hop
-        if from_asn not in self.rib_in:
-            self.rib_in[from_asn] = {}
-        
-        imported_route.next_hop = from_asn
-        self.rib_in[from_asn][route.prefix] = imported_route
+        # apply_import may hand back the sender's route unchanged; only
+        # clone if next_hop actually needs rewriting (advertisements
+        # already carry the sender as next_hop, so this is rare)
+        if imported_route.next_hop != from_asn:
+            if imported_route is route:
+                imported_route = route.clone()
+            imported_route.next_hop = from_asn
+        self.rib_in[(from_asn, route.prefix)] = imported_route
+        self._advertisers.setdefault(route.prefix, set()).add(from_asn)
         
-        print(f"AS{self.asn} stored route in RIB-IN from AS{from_asn}")
+        logger.debug("AS%s stored route in RIB-IN from AS%s", self.asn, from_asn)
         
         # Run decision process
         changed = self._run_decision_process(route.prefix)
-        print(f"AS{self.asn} decision process result: changed={changed}")
-        print(f"AS{self.asn} current RIB: {self.rib}")
+        if changed:
+            self.dirty_prefixes.add(route.prefix)
+        logger.debug("AS%s decision process result: changed=%s", self.asn, changed)
+        logger.debug("AS%s current RIB: %s", self.asn, self.rib)
         return changed
     
     def withdraw_route(self, prefix: str, from_asn: str) -> bool:
@@ -126,9 +146,13 @@ class ASNode:
         Returns:
             True if this caused a change in the best route
         """
-        if from_asn in self.rib_in and prefix in self.rib_in[from_asn]:
-            del self.rib_in[from_asn][prefix]
-            return self._run_decision_process(prefix)
+        if (from_asn, prefix) in self.rib_in:
+            del self.rib_in[(from_asn, prefix)]
+            self._advertisers[prefix].discard(from_asn)
+            changed = self._run_decision_process(prefix)
+            if changed:
+                self.dirty_prefixes.add(prefix)
+            return changed
         return False
     
     def _run_decision_process(self, prefix: str) -> bool:
@@ -141,38 +165,41 @@ class ASNode:
         Returns:
             True if the best route changed
         """
-        print(f"AS{self.asn} running decision process for prefix {prefix}")
+        logger.debug("AS%s running decision process for prefix %s", self.asn, prefix)
         
-        # Collect all candidate routes
+        # Collect all candidate routes (only neighbors advertising this prefix)
         candidates: List[Tuple[Route, str]] = []
-        for neighbor, routes in self.rib_in.items():
-            if prefix in routes:
-                route = routes[prefix]
-                candidates.append((route, neighbor))
-                print(f"Candidate from AS{neighbor}: {route.as_path}")
+        for neighbor in self._advertisers.get(prefix, ()):
+            route = self.rib_in[(neighbor, prefix)]
+            candidates.append((route, neighbor))
+            logger.debug("Candidate from AS%s: %s", neighbor, route.as_path)
         
         if not candidates:
-            print(f"AS{self.asn} no candidates available for {prefix}")
+            logger.debug("AS%s no candidates available for %s", self.asn, prefix)
             # No routes available, remove from RIB
             if prefix in self.rib:
                 del self.rib[prefix]
-                print(f"AS{self.asn} removed route for {prefix} from RIB")
+                self._invalidate_adv_cache(prefix)
+                logger.debug("AS%s removed route for %s from RIB", self.asn, prefix)
                 return True
             return False
         
         # Select best route using BGP decision process
         best_route = self._select_best_route(candidates)
-        print(f"AS{self.asn} selected best route: {best_route.as_path}")
+        logger.debug("AS%s selected best route: %s", self.asn, best_route.as_path)
         
         # Check if best route changed
         old_best = self.rib.get(prefix)
         if old_best and self._routes_equal(old_best, best_route):
-            print(f"AS{self.asn} best route unchanged")
+            logger.debug("AS%s best route unchanged", self.asn)
             return False
         
-        # Store new best route
-        self.rib[prefix] = best_route.clone()
-        print(f"AS{self.asn} updated RIB with new best route for {prefix}")
+        # Store new best route. The RIB shares the RIB-In instance; nothing
+        # mutates RIB entries in place (advertisement clones first), so the
+        # defensive copy here was pure allocation churn
+        self.rib[prefix] = best_route
+        self._invalidate_adv_cache(prefix)
+        logger.debug("AS%s updated RIB with new best route for %s", self.asn, prefix)
         return True
     
     def _select_best_route(self, candidates: List[Tuple[Route, str]]) -> Route:
@@ -187,33 +214,27 @@ class ASNode:
         """
         if len(candidates) == 1:
             return candidates[0][0]
-        
-        # Group routes by next hop AS to compare MEDs correctly
-        routes_by_first_as = {}
-        for route, neighbor in candidates:
+
+        # Filter cascade: the cached _decision_key covers LOCAL_PREF,
+        # AS_PATH length and origin in one comparison, so a single
+        # linear pass keeps only the candidates tied on all three —
+        # usually exactly one, short-circuiting the MED stage entirely
+        best_key = min(route._decision_key for route, _ in candidates)
+        survivors = [c for c in candidates if c[0]._decision_key == best_key]
+        if len(survivors) == 1:
+            return survivors[0][0]
+
+        # MED is only comparable among routes from the same first AS
+        # (RFC 4271); keep the lowest (med, neighbor) per group
+        best_per_as = {}
+        for route, neighbor in survivors:
             first_as = route.as_path[0] if route.as_path else neighbor
-            if first_as not in routes_by_first_as:
-                routes_by_first_as[first_as] = []
-            routes_by_first_as[first_as].append((route, neighbor))
-        
-        # For each next hop AS, select best route considering MED
-        best_per_as = []
-        for routes in routes_by_first_as.values():
-            routes.sort(key=lambda x: (x[0].med, x[1]))
-            best_per_as.append(routes[0])
-        
-        # Final comparison across different next hop ASes
-        def compare_key(item):
-            route, neighbor = item
-            return (
-                -route.local_pref,
-                len(route.as_path),
-                route.origin.value,
-                neighbor
-            )
-        
-        best_per_as.sort(key=compare_key)
-        return best_per_as[0][0]
+            current = best_per_as.get(first_as)
+            if current is None or (route.med, neighbor) < (current[0].med, current[1]):
+                best_per_as[first_as] = (route, neighbor)
+
+        # Remaining ties break on lowest neighbor ASN
+        return min(best_per_as.values(), key=lambda item: item[1])[0]
     
     def _routes_equal(self, r1: Route, r2: Route) -> bool:
         """
@@ -226,54 +247,91 @@ class ASNode:
         Returns:
             True if routes are equal
         """
-        return (r1.as_path == r2.as_path and 
-                r1.local_pref == r2.local_pref and
-                r1.origin == r2.origin)
+        # Identity fast path: after convergence the stored best route is
+        # usually the same object as the re-selected one
+        if r1 is r2:
+            return True
+        # Compare cheap scalars before walking the AS path list
+        if r1.local_pref != r2.local_pref or r1.origin is not r2.origin:
+            return False
+        return r1.as_path == r2.as_path
     
-    def get_routes_to_advertise(self) -> Dict[str, Route]:
+    def get_routes_to_advertise(self) -> Mapping[str, Route]:
         """
         Get routes to advertise to neighbors
-        
+
         Returns:
-            Dictionary of prefix -> route
+            Read-only mapping of prefix -> route (no copy)
         """
-        return self.rib.copy()
+        return MappingProxyType(self.rib)
     
     def prepare_advertisement(self, route: Route, to_asn: str) -> Optional[Route]:
         """
         Prepare route for advertisement to neighbor
-        
+
+        The exported route (policy + path prepend) does not depend on the
+        recipient, so it is built once per prefix and shared across all
+        neighbors until the RIB entry changes; only the split-horizon
+        check is per-neighbor.
+
         Args:
             route: Route to advertise
             to_asn: AS number of recipient
-            
+
         Returns:
             Prepared route, or None if filtered
         """
-        print(f"AS{self.asn} preparing advertisement to AS{to_asn} for prefix {route.prefix}")
-        
         # Don't advertise routes learned from this neighbor (split horizon)
         if route.next_hop == to_asn:
-            print(f"Skipping route learned from AS{to_asn}")
+            logger.debug("Skipping route learned from AS%s", to_asn)
             return None
-            
-        # Apply export policy
-        exported = self.policy.apply_export(route, to_asn)
+
+        prefix = route.prefix
+        if prefix in self._adv_cache:
+            return self._adv_cache[prefix]
+
+        prepared = self._build_advertisement(route)
+        self._adv_cache[prefix] = prepared
+        return prepared
+
+    def _build_advertisement(self, route: Route) -> Optional[Route]:
+        """
+        Build the neighbor-agnostic advertisement for a route (uncached)
+
+        Args:
+            route: Route to advertise
+
+        Returns:
+            Prepared route, or None if filtered by export policy
+        """
+        logger.debug("AS%s preparing advertisement for prefix %s", self.asn, route.prefix)
+
+        # Apply export policy; apply_export returns a private clone, so
+        # it is safe to modify in place here
+        exported = self.policy.apply_export(route, self.asn)
         if not exported:
-            print(f"Route filtered by export policy")
+            logger.debug("Route filtered by export policy")
             return None
-        
-        # Create a new copy for modification
-        exported = exported.clone()
-        
+
         # Prepend own ASN to path if not already there
         if not exported.as_path or exported.as_path[0] != self.asn:
-            exported.as_path.insert(0, self.asn)
+            exported.as_path = (self.asn,) + exported.as_path
+            exported.as_path_set.add(self.asn)
+            exported._refresh_decision_key()
         exported.next_hop = self.asn
         
-        print(f"Prepared route: prefix={exported.prefix}, as_path={exported.as_path}, next_hop={exported.next_hop}")
+        logger.debug("Prepared route: prefix=%s, as_path=%s, next_hop=%s", exported.prefix, exported.as_path, exported.next_hop)
         return exported
-    
+
+    def _invalidate_adv_cache(self, prefix: str):
+        """
+        Drop cached advertisements for a prefix after its RIB entry changes
+
+        Args:
+            prefix: Prefix whose cached advertisement is stale
+        """
+        self._adv_cache.pop(prefix, None)
+
     def __repr__(self) -> str:
         """String representation of AS node"""
         return f"ASNode(AS{self.asn}, neighbors={len(self.neighbors)}, routes={len(self.rib)})"
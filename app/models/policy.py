@@ -6,10 +6,19 @@ Implements import and export policies
 from typing import Dict, List, Optional, Tuple
 from app.models.route import Route
 
+# Optional (not required for core functionality)
+try:
+    import pytricia
+except ImportError:
+    pytricia = None
+
 
 class Policy:
     """BGP routing policy"""
-    
+
+    __slots__ = ('local_pref_map', 'export_filters', 'deny_prefixes',
+                 '_deny_trie', 'as_path_prepend')
+
     def __init__(self, config: Optional[dict] = None):
         """
         Initialize policy from configuration
@@ -25,6 +34,21 @@ class Policy:
             self.local_pref_map = config.get("local_pref", {})
             self.export_filters = config.get("export_filters", [])
             self.as_path_prepend = config.get("as_path_prepend", 0)
+
+        # Denied prefixes as a set so apply_export does one hash probe
+        # instead of scanning the filter list per advertisement
+        self.deny_prefixes = frozenset(
+            prefix for action, prefix in self.export_filters if action == "deny"
+        )
+
+        # With pytricia installed, deny filters get a radix trie and
+        # longest-prefix-match semantics; otherwise exact matching
+        # against the frozenset
+        self._deny_trie = None
+        if pytricia is not None and self.deny_prefixes:
+            self._deny_trie = pytricia.PyTricia()
+            for prefix in self.deny_prefixes:
+                self._deny_trie[prefix] = True
     
     def apply_import(self, route: Route, from_asn: str) -> Route:
         """
@@ -37,12 +61,16 @@ class Policy:
         Returns:
             Modified route with import policy applied
         """
+        # No LOCAL_PREF override for this neighbor: the route is accepted
+        # as-is, so skip the clone entirely. Receivers never mutate an
+        # imported route in place (receive_route clones before rewriting
+        # next_hop when needed), so sharing the instance is safe
+        if from_asn not in self.local_pref_map:
+            return route
+
         modified = route.clone()
-        
-        # Apply LOCAL_PREF based on neighbor
-        if from_asn in self.local_pref_map:
-            modified.local_pref = self.local_pref_map[from_asn]
-        
+        modified.local_pref = self.local_pref_map[from_asn]
+        modified._refresh_decision_key()
         return modified
     
     def apply_export(self, route: Route, to_asn: str) -> Optional[Route]:
@@ -57,17 +85,21 @@ class Policy:
             Modified route with export policy applied, or None if filtered
         """
         # Check export filters
-        for action, prefix in self.export_filters:
-            if action == "deny" and route.prefix == prefix:
+        if self._deny_trie is not None:
+            if route.prefix in self._deny_trie:
                 return None
-        
+        elif route.prefix in self.deny_prefixes:
+            return None
+
         modified = route.clone()
         
         # AS_PATH prepending
         if self.as_path_prepend > 0:
-            for _ in range(self.as_path_prepend):
-                modified.as_path.insert(0, modified.as_path[0] if modified.as_path else to_asn)
-        
+            head = modified.as_path[0] if modified.as_path else to_asn
+            modified.as_path = (head,) * self.as_path_prepend + modified.as_path
+            modified.as_path_set.add(head)
+            modified._refresh_decision_key()
+
         return modified
     
     def __repr__(self) -> str:
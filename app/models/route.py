@@ -3,11 +3,11 @@ BGP Route Model
 Represents a BGP route with all attributes
 """
 
-from enum import Enum
+from enum import IntEnum
 from typing import List, Optional
 
 
-class OriginType(Enum):
+class OriginType(IntEnum):
     """BGP Origin Types"""
     IGP = 0  # Interior Gateway Protocol (best)
     EGP = 1  # Exterior Gateway Protocol
@@ -16,7 +16,10 @@ class OriginType(Enum):
 
 class Route:
     """Represents a BGP route"""
-    
+
+    __slots__ = ('prefix', 'as_path', 'as_path_set', 'origin',
+                 'local_pref', 'med', 'next_hop', '_decision_key', '_as_dict')
+
     def __init__(self, prefix: str, as_path: List[str], 
                  origin: OriginType = OriginType.IGP,
                  local_pref: int = 100, med: int = 0,
@@ -33,12 +36,23 @@ class Route:
             next_hop: Next hop AS number
         """
         self.prefix = prefix
-        self.as_path = as_path.copy()
+        # Stored as an immutable tuple: clones share it without copying,
+        # and path changes build a new tuple at C speed
+        self.as_path = tuple(as_path)
+        # Mutable on purpose: the prepend paths extend it in place rather
+        # than building a temporary one-element set per advertisement
+        self.as_path_set = set(as_path)
         self.origin = origin
         self.local_pref = local_pref
         self.med = med
         self.next_hop = next_hop
-    
+        self._decision_key = (-local_pref, len(self.as_path), origin.value)
+        self._as_dict = None
+
+    def _refresh_decision_key(self):
+        """Recompute the cached decision-process sort key after mutation"""
+        self._decision_key = (-self.local_pref, len(self.as_path), self.origin.value)
+
     def has_loop(self, asn: str) -> bool:
         """
         Check if ASN is in path (loop detection)
@@ -49,23 +63,30 @@ class Route:
         Returns:
             True if ASN is in path, False otherwise
         """
-        return asn in self.as_path
+        return asn in self.as_path_set
     
     def clone(self) -> 'Route':
         """
-        Create a deep copy of the route
-        
+        Create a copy of the route
+
+        Copies attributes directly instead of going through __init__,
+        which would re-hash the whole path to rebuild as_path_set. The
+        path tuple is shared (immutable); the set is copied at C speed.
+
         Returns:
             Cloned Route object
         """
-        return Route(
-            prefix=self.prefix,
-            as_path=self.as_path.copy(),
-            origin=self.origin,
-            local_pref=self.local_pref,
-            med=self.med,
-            next_hop=self.next_hop
-        )
+        cloned = Route.__new__(Route)
+        cloned.prefix = self.prefix
+        cloned.as_path = self.as_path
+        cloned.as_path_set = self.as_path_set.copy()
+        cloned.origin = self.origin
+        cloned.local_pref = self.local_pref
+        cloned.med = self.med
+        cloned.next_hop = self.next_hop
+        cloned._decision_key = self._decision_key
+        cloned._as_dict = None  # clones exist to be mutated
+        return cloned
     
     def to_dict(self) -> dict:
         """
@@ -74,14 +95,18 @@ class Route:
         Returns:
             Dictionary with route attributes
         """
-        return {
-            "prefix": self.prefix,
-            "as_path": self.as_path,
-            "origin": self.origin.name,
-            "local_pref": self.local_pref,
-            "med": self.med,
-            "next_hop": self.next_hop
-        }
+        # Cached: routes are only serialized after the simulation ends,
+        # and one advertisement instance may sit in many nodes' RIBs
+        if self._as_dict is None:
+            self._as_dict = {
+                "prefix": self.prefix,
+                "as_path": list(self.as_path),
+                "origin": self.origin.name,
+                "local_pref": self.local_pref,
+                "med": self.med,
+                "next_hop": self.next_hop
+            }
+        return self._as_dict
     
     def __repr__(self) -> str:
         """String representation of route"""
@@ -3,13 +3,23 @@ API Routes Blueprint
 Handles REST API endpoints
 """
 
-from flask import Blueprint, request, jsonify, current_app
+import gzip
+import hashlib
+import json
+
+from flask import Blueprint, request, jsonify, current_app, Response
 from app.utils import run_simulation, validate_config
 from app.utils.validators import ValidationError
 from app.routes.examples import get_examples
 
 api_bp = Blueprint('api', __name__)
 
+# The examples payload is static, so build and serialize it once at
+# import time instead of on every GET
+_EXAMPLES_JSON = json.dumps(get_examples()).encode()
+_EXAMPLES_GZ = gzip.compress(_EXAMPLES_JSON, compresslevel=9)
+_EXAMPLES_ETAG = hashlib.md5(_EXAMPLES_JSON).hexdigest()
+
 
 @api_bp.route('/status', methods=['GET'])
 def status():
@@ -64,18 +74,18 @@ def simulate():
             return jsonify({"error": str(e)}), 400
         
         # Run simulation
-        current_app.logger.info(f"Running simulation with config: {validated_config}")
+        current_app.logger.info("Running simulation with config: %s", validated_config)
         results = run_simulation(validated_config)
         
-        current_app.logger.info(f"Simulation completed successfully")
+        current_app.logger.info("Simulation completed successfully")
         return jsonify(results)
     
     except ValidationError as e:
-        current_app.logger.warning(f"Validation error: {str(e)}")
+        current_app.logger.warning("Validation error: %s", e)
         return jsonify({"error": str(e)}), 400
     
     except Exception as e:
-        current_app.logger.error(f"Simulation error: {str(e)}", exc_info=True)
+        current_app.logger.error("Simulation error: %s", e, exc_info=True)
         return jsonify({"error": f"Simulation failed: {str(e)}"}), 500
 
 
@@ -87,12 +97,20 @@ def examples():
     Returns:
         JSON response with example configurations
     """
-    try:
-        examples_data = get_examples()
-        return jsonify(examples_data)
-    except Exception as e:
-        current_app.logger.error(f"Error loading examples: {str(e)}")
-        return jsonify({"error": "Failed to load examples"}), 500
+    if request.if_none_match.contains(_EXAMPLES_ETAG):
+        return Response(status=304)
+
+    # Serve the gzip variant compressed once at import time when the
+    # client accepts it
+    if 'gzip' in request.headers.get('Accept-Encoding', ''):
+        response = Response(_EXAMPLES_GZ, mimetype='application/json')
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = Response(_EXAMPLES_JSON, mimetype='application/json')
+
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.set_etag(_EXAMPLES_ETAG)
+    return response
 
 
 @api_bp.route('/validate', methods=['POST'])
@@ -124,5 +142,5 @@ def validate():
             }), 400
     
     except Exception as e:
-        current_app.logger.error(f"Validation error: {str(e)}")
+        current_app.logger.error("Validation error: %s", e)
         return jsonify({"error": str(e)}), 500
@@ -3,7 +3,7 @@ Utilities Package
 Helper functions and simulation engine
 """
 
-from app.utils.simulator import BGPSimulator, run_simulation
+from app.utils.simulator import BGPSimulator, run_simulation, run_batch
 from app.utils.validators import validate_config
 
-__all__ = ['BGPSimulator', 'run_simulation', 'validate_config']
+__all__ = ['BGPSimulator', 'run_simulation', 'run_batch', 'validate_config']
@@ -3,13 +3,57 @@ BGP Simulator Utilities
 Main simulation engine and helpers
 """
 
-from typing import Dict, List
-from app.models import Route, ASNode, Policy
+import logging
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Deque, Dict, List, Optional
+from app.models import ASNode, Policy
+
+logger = logging.getLogger(__name__)
+
+
+class Event:
+    """Timeline event record
+
+    A fixed slotted record instead of a per-event dict; converted to a
+    dict only when results are serialized.
+    """
+
+    __slots__ = ('timestamp', 'event_type', 'from_as', 'to_as', 'prefix', 'details')
+
+    def __init__(self, timestamp: int, event_type: str, from_as: str = None,
+                 to_as: str = None, prefix: str = None, details: str = None):
+        self.timestamp = timestamp
+        self.event_type = event_type
+        self.from_as = from_as
+        self.to_as = to_as
+        self.prefix = prefix
+        self.details = details
+
+    def to_dict(self) -> dict:
+        """Convert event to dictionary, omitting unset fields"""
+        event = {
+            "timestamp": self.timestamp,
+            "event_type": self.event_type
+        }
+        if self.from_as is not None:
+            event["from_as"] = self.from_as
+        if self.to_as is not None:
+            event["to_as"] = self.to_as
+        if self.prefix is not None:
+            event["prefix"] = self.prefix
+        if self.details is not None:
+            event["details"] = self.details
+        return event
 
 
 class BGPSimulator:
     """Main BGP simulation engine"""
-    
+
+    __slots__ = ('config', 'nodes', 'timeline', '_event_counter',
+                 'current_step', 'max_steps', 'record_timeline',
+                 'best_route_changes_total')
+
     def __init__(self, config: dict):
         """
         Initialize simulator
@@ -19,9 +63,11 @@ class BGPSimulator:
         """
         self.config = config
         self.nodes: Dict[str, ASNode] = {}
-        self.timeline: List[dict] = []
+        self.timeline: Deque[Event] = deque()
+        self._event_counter = Counter()
         self.current_step = 0
         self.max_steps = config.get('max_steps', 100)
+        self.record_timeline = config.get('record_timeline', True)
         self.best_route_changes_total = 0
     
     def build_topology(self):
@@ -29,14 +75,25 @@ class BGPSimulator:
         # Create nodes with policies
         policies = self.config.get("policies", {})
         for node_asn in self.config["nodes"]:
-            policy = Policy(policies.get(node_asn)) if node_asn in policies else Policy()
+            # Nodes without explicit config fall through to the shared
+            # default Policy inside ASNode
+            policy = Policy(policies.get(node_asn)) if node_asn in policies else None
             self.nodes[node_asn] = ASNode(node_asn, policy)
         
-        # Add links (bidirectional)
-        for link in self.config["links"]:
-            asn1, asn2 = link
-            self.nodes[asn1].add_neighbor(asn2)
-            self.nodes[asn2].add_neighbor(asn1)
+        # Build the (bidirectional) adjacency in one bulk pass instead of
+        # two add_neighbor calls per link
+        adj = {asn: [] for asn in self.config["nodes"]}
+        for asn1, asn2 in self.config["links"]:
+            adj[asn1].append(asn2)
+            adj[asn2].append(asn1)
+
+        # Assign neighbors per node in one shot, resolving ASNs to direct
+        # node references so the propagation loop doesn't hash ASN
+        # strings through self.nodes on every advertisement
+        for asn, node in self.nodes.items():
+            neighbors = list(dict.fromkeys(adj[asn]))  # dedupe, keep order
+            node.neighbors = set(neighbors)
+            node.neighbor_refs = [self.nodes[n] for n in neighbors]
     
     def log_event(self, event_type: str, **kwargs):
         """
@@ -46,12 +103,11 @@ class BGPSimulator:
             event_type: Type of event
             **kwargs: Event attributes
         """
-        event = {
-            "timestamp": self.current_step,
-            "event_type": event_type,
-            **kwargs
-        }
-        self.timeline.append(event)
+        # Counters always run so metrics stay accurate; the Event record
+        # itself is skipped when the caller opted out of the timeline
+        self._event_counter[event_type] += 1
+        if self.record_timeline:
+            self.timeline.append(Event(self.current_step, event_type, **kwargs))
     
     def run(self) -> dict:
         """
@@ -91,26 +147,26 @@ class BGPSimulator:
         origin_asn = self.config["origin_as"]
         prefixes = self.config["prefixes"]
         
-        print(f"\nStarting baseline scenario with origin AS{origin_asn}")
-        print(f"Prefixes to announce: {prefixes}")
+        logger.debug("Starting baseline scenario with origin AS%s", origin_asn)
+        logger.debug("Prefixes to announce: %s", prefixes)
         
         # Origin announces prefixes
         for prefix in prefixes:
-            print(f"\nOrigin AS{origin_asn} announcing prefix {prefix}")
+            logger.debug("Origin AS%s announcing prefix %s", origin_asn, prefix)
             route = self.nodes[origin_asn].originate_route(prefix)
             self.log_event("update", from_as=origin_asn, prefix=prefix,
                          details="Origin announcement")
         
         # Propagate until convergence
-        print("\nStarting route propagation")
+        logger.debug("Starting route propagation")
         self._propagate_until_convergence()
         
-        # Verify final routing tables
-        print("\nFinal Routing Tables:")
-        for asn, node in self.nodes.items():
-            print(f"\nAS{asn} RIB:")
-            for prefix, route in node.rib.items():
-                print(f"  {prefix}: AS_PATH={route.as_path}, next_hop={route.next_hop}")
+        # Trace final routing tables when debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            for asn, node in self.nodes.items():
+                logger.debug("AS%s RIB:", asn)
+                for prefix, route in node.rib.items():
+                    logger.debug("  %s: AS_PATH=%s, next_hop=%s", prefix, route.as_path, route.next_hop)
     
     def _run_hijack(self):
         """Run BGP hijack scenario"""
@@ -175,43 +231,47 @@ class BGPSimulator:
             self.current_step += 1
             iteration += 1
             
-            # Keep track of updates to process in this iteration
-            updates_to_process = []
-            
-            # Each node advertises its best routes to neighbors
+            sent_any = False
+
+            # Each node advertises only the prefixes whose best route
+            # changed since it last advertised, so work is proportional
+            # to actual updates rather than topology size x RIB size.
+            # Advertisements are dispatched inline: receive_route only
+            # touches the receiving node, so no staging list is needed
             for asn, node in self.nodes.items():
-                routes_to_advertise = node.get_routes_to_advertise()
-                
-                for neighbor_asn in node.neighbors:
-                    neighbor = self.nodes[neighbor_asn]
-                    
-                    for prefix, route in routes_to_advertise.items():
-                        # Prepare advertisement
-                        adv_route = node.prepare_advertisement(route, neighbor_asn)
-                        
-                        if adv_route:
-                            updates_to_process.append((asn, neighbor_asn, prefix, adv_route))
-            
-            # Process all queued updates
-            for update in updates_to_process:
-                from_asn, to_asn, prefix, adv_route = update
-                neighbor = self.nodes[to_asn]
-                
-                # Send to neighbor
-                changed = neighbor.receive_route(adv_route, from_asn)
-                
-                if changed:
-                    self.best_route_changes_total += 1
-                    converged = False
-                    self.log_event("update", from_as=from_asn, to_as=to_asn,
-                                 prefix=prefix, 
-                                 details=f"Route update")
-            
-            # Send keepalives only if no updates were processed
-            if not updates_to_process:
-                for asn, node in self.nodes.items():
-                    for neighbor in node.neighbors:
-                        self.log_event("keepalive", from_as=asn, to_as=neighbor)
+                if not node.dirty_prefixes:
+                    continue
+                dirty_prefixes = node.dirty_prefixes
+                node.dirty_prefixes = set()
+
+                for prefix in dirty_prefixes:
+                    route = node.rib.get(prefix)
+                    if route is None:
+                        # Best route withdrawn; this simulator does not
+                        # propagate explicit withdrawals
+                        continue
+
+                    for neighbor in node.neighbor_refs:
+                        # Prepare and send advertisement
+                        adv_route = node.prepare_advertisement(route, neighbor.asn)
+                        if not adv_route:
+                            continue
+                        sent_any = True
+
+                        if neighbor.receive_route(adv_route, asn):
+                            self.best_route_changes_total += 1
+                            converged = False
+                            self.log_event("update", from_as=asn, to_as=neighbor.asn,
+                                         prefix=prefix,
+                                         details="Route update")
+
+            # Send keepalives only if no updates were sent; one summary
+            # event per quiet round instead of one per session, which
+            # kept O(edges) events out of the timeline payload
+            if not sent_any:
+                session_count = sum(len(node.neighbors) for node in self.nodes.values())
+                self.log_event("keepalive",
+                             details=f"{session_count} keepalives exchanged")
     
     def _generate_results(self) -> dict:
         """
@@ -220,17 +280,40 @@ class BGPSimulator:
         Returns:
             Dictionary with results
         """
-        # Collect final RIBs
+        # Single fused pass over the nodes: build the JSON-ready RIBs and
+        # accumulate the metric partials in the same traversal
+        hijacker = self.config.get("hijacker") \
+            if self.config.get("scenario") == "hijack" else None
+        prefixes_set = frozenset(self.config.get("prefixes", []))
+
         final_ribs = {}
+        stats = {
+            "path_len_total": 0,
+            "route_count": 0,
+            "reachable": 0,
+            "hijacked": 0,
+            "hijack_total": 0,
+        }
+
         for asn, node in self.nodes.items():
-            final_ribs[asn] = {
-                prefix: route.to_dict() 
-                for prefix, route in node.rib.items()
-            }
-        
+            # Reachable pairs via C-level set intersection rather than a
+            # per-route membership test
+            stats["reachable"] += len(prefixes_set & node.rib.keys())
+
+            rib_dict = {}
+            for prefix, route in node.rib.items():
+                rib_dict[prefix] = route.to_dict()
+                stats["path_len_total"] += len(route.as_path)
+                stats["route_count"] += 1
+                if hijacker is not None and asn != hijacker:
+                    stats["hijack_total"] += 1
+                    if hijacker in route.as_path_set:
+                        stats["hijacked"] += 1
+            final_ribs[asn] = rib_dict
+
         # Calculate metrics
-        metrics = self._calculate_metrics(final_ribs)
-        
+        metrics = self._calculate_metrics(stats)
+
         # Generate topology representation
         topology = {
             "nodes": [{"id": asn} for asn in self.nodes.keys()],
@@ -241,90 +324,49 @@ class BGPSimulator:
         }
         
         return {
-            "timeline": self.timeline,
+            "timeline": [event.to_dict() for event in self.timeline],
             "metrics": metrics,
             "final_ribs": final_ribs,
             "topology": topology
         }
     
-    def _calculate_metrics(self, final_ribs: dict) -> dict:
+    def _calculate_metrics(self, stats: dict) -> dict:
         """
-        Calculate simulation metrics
-        
+        Finalize simulation metrics
+
         Args:
-            final_ribs: Final routing tables
-            
+            stats: Partial sums collected during the final-RIB pass
+
         Returns:
             Dictionary with metrics
         """
-        # Count event types
-        event_counts = {}
-        for event in self.timeline:
-            event_type = event["event_type"]
-            event_counts[event_type] = event_counts.get(event_type, 0) + 1
-        
+        # Event counts are maintained live by log_event, so no re-scan of
+        # the timeline is needed here
         metrics = {
             "convergence_steps": self.current_step,
-            "total_updates": event_counts.get("update", 0),
-            "total_events": len(self.timeline),
+            "total_updates": self._event_counter.get("update", 0),
+            "total_events": sum(self._event_counter.values()),
             "best_route_changes_total": self.best_route_changes_total
         }
-        
+
         # Average AS path length
-        total_len = 0
-        route_count = 0
-        for rib in final_ribs.values():
-            for route in rib.values():
-                total_len += len(route["as_path"]) if "as_path" in route else 0
-                route_count += 1
-        metrics["avg_as_path_length"] = (total_len / route_count) if route_count > 0 else 0.0
+        route_count = stats["route_count"]
+        metrics["avg_as_path_length"] = (stats["path_len_total"] / route_count) if route_count > 0 else 0.0
         metrics["routes_learned_total"] = route_count
-        
+
         # Reachable prefixes percent
         prefixes = self.config.get("prefixes", [])
         if prefixes:
             total_pairs = len(self.nodes) * len(prefixes)
-            reachable = 0
-            for asn, rib in final_ribs.items():
-                for p in prefixes:
-                    if p in rib:
-                        reachable += 1
-            metrics["reachable_prefix_pairs_pct"] = (reachable / total_pairs * 100.0) if total_pairs > 0 else 0.0
-        
-        # Calculate hijack coverage if applicable
-        if self.config.get("scenario") == "hijack":
-            hijacker = self.config.get("hijacker")
-            if hijacker:
-                metrics["hijack_coverage_pct"] = self._calculate_hijack_coverage(
-                    final_ribs, hijacker
-                )
-        
+            metrics["reachable_prefix_pairs_pct"] = (stats["reachable"] / total_pairs * 100.0) if total_pairs > 0 else 0.0
+
+        # Hijack coverage: percentage of routes (outside the hijacker)
+        # that go through the hijacker
+        if self.config.get("scenario") == "hijack" and self.config.get("hijacker"):
+            total_count = stats["hijack_total"]
+            metrics["hijack_coverage_pct"] = (stats["hijacked"] / total_count * 100) if total_count > 0 else 0.0
+
         return metrics
-    
-    def _calculate_hijack_coverage(self, ribs: dict, hijacker: str) -> float:
-        """
-        Calculate percentage of nodes routing through hijacker
-        
-        Args:
-            ribs: Final routing tables
-            hijacker: Hijacker AS number
-            
-        Returns:
-            Percentage of hijacked routes
-        """
-        hijacked_count = 0
-        total_count = 0
-        
-        for asn, rib in ribs.items():
-            if asn == hijacker:
-                continue
-            
-            for prefix, route in rib.items():
-                total_count += 1
-                if hijacker in route["as_path"]:
-                    hijacked_count += 1
-        
-        return (hijacked_count / total_count * 100) if total_count > 0 else 0.0
 
 
 def run_simulation(config: dict) -> dict:
@@ -339,3 +381,22 @@ def run_simulation(config: dict) -> dict:
     """
     simulator = BGPSimulator(config)
     return simulator.run()
+
+
+def run_batch(configs: List[dict], workers: Optional[int] = None) -> List[dict]:
+    """
+    Run multiple simulations in parallel worker processes
+
+    Simulations share no state, so parameter sweeps (topologies,
+    scenarios, hijackers) scale with cores instead of serializing
+    behind the GIL.
+
+    Args:
+        configs: List of simulation configurations
+        workers: Number of worker processes (default: one per CPU)
+
+    Returns:
+        List of simulation results, in the same order as configs
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run_simulation, configs))
@@ -3,15 +3,60 @@ Configuration Validators
 Validation functions for simulation configurations
 """
 
-from typing import Dict, List, Any
+import re
+import sys
+from functools import lru_cache
+from typing import Dict, Any
 from flask import current_app
 
+# Optional (not required for core functionality)
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
 
 class ValidationError(Exception):
     """Custom exception for validation errors"""
     pass
 
 
+_VALID_SCENARIOS = frozenset(("baseline", "hijack", "route_flap"))
+
+
+# Structural schema for simulation configs. Cross-field rules (link
+# endpoints, origin_as membership, policy contents) can't be expressed
+# here and stay in validate_config.
+_CONFIG_SCHEMA = {
+    "type": "object",
+    "required": ["nodes", "links"],
+    "properties": {
+        "nodes": {
+            "type": "array",
+            "minItems": 1,
+            "items": {"type": "string"}
+        },
+        "links": {
+            "type": "array",
+            "items": {
+                "type": "array",
+                "minItems": 2,
+                "maxItems": 2,
+                "items": {"type": "string"}
+            }
+        },
+        "prefixes": {
+            "type": "array",
+            "items": {"type": "string"}
+        }
+    }
+}
+
+# Compile once per process; compiling per request would cost more than
+# the validation itself
+_SCHEMA_VALIDATOR = fastjsonschema.compile(_CONFIG_SCHEMA) if fastjsonschema else None
+
+
 def validate_config(config: dict) -> Dict[str, Any]:
     """
     Validate simulation configuration
@@ -27,71 +72,86 @@ def validate_config(config: dict) -> Dict[str, Any]:
     """
     if not isinstance(config, dict):
         raise ValidationError("Configuration must be a dictionary")
-    
-    # Validate required fields
-    if "nodes" not in config:
-        raise ValidationError("Missing required field: 'nodes'")
-    
-    if "links" not in config:
-        raise ValidationError("Missing required field: 'links'")
-    
-    # Validate nodes
+
+    # Validate structure (precompiled schema when available)
+    if _SCHEMA_VALIDATOR is not None:
+        try:
+            _SCHEMA_VALIDATOR(config)
+        except fastjsonschema.JsonSchemaException as e:
+            raise ValidationError(str(e)) from None
+    else:
+        _check_structure(config)
+
+    # Resolve the current_app LocalProxy once instead of per lookup
+    app_config = current_app.config
+
     nodes = config["nodes"]
-    if not isinstance(nodes, list) or len(nodes) == 0:
-        raise ValidationError("'nodes' must be a non-empty list")
-    
+
     # Check max nodes limit
-    max_nodes = current_app.config.get('MAX_NODES', 100)
+    max_nodes = app_config.get('MAX_NODES', 100)
     if len(nodes) > max_nodes:
         raise ValidationError(f"Too many nodes (max: {max_nodes})")
-    
-    # Validate all nodes are strings
+
+    # Single pass over nodes: type check, duplicate detection, set build
+    # and interning. ASNs end up as dict keys and set members all over the
+    # simulator; interned strings hit the identity fast path on lookup
+    nodes_set = set()
+    interned_nodes = []
     for node in nodes:
         if not isinstance(node, str):
             raise ValidationError(f"Node {node} must be a string")
-    
-    # Validate links
-    links = config["links"]
-    if not isinstance(links, list):
-        raise ValidationError("'links' must be a list")
-    
-    for link in links:
-        if not isinstance(link, list) or len(link) != 2:
-            raise ValidationError(f"Link {link} must be a list of 2 elements")
-        
-        # Check that both nodes exist
-        if link[0] not in nodes or link[1] not in nodes:
+        node = sys.intern(node)
+        if node in nodes_set:
+            raise ValidationError(f"Duplicate node: {node}")
+        nodes_set.add(node)
+        interned_nodes.append(node)
+    nodes = interned_nodes
+    config["nodes"] = nodes
+
+    # Check that both ends of each link are strings and exist; the type
+    # check must come first because non-strings are unhashable for the
+    # set lookup
+    links = []
+    for link in config["links"]:
+        if not isinstance(link[0], str) or not isinstance(link[1], str):
+            raise ValidationError(f"Link {link} endpoints must be strings")
+        if link[0] not in nodes_set or link[1] not in nodes_set:
             raise ValidationError(f"Link {link} references non-existent node")
-    
+        links.append([sys.intern(link[0]), sys.intern(link[1])])
+    config["links"] = links
+
     # Validate prefixes
     prefixes = config.get("prefixes", ["10.0.1.0/24"])
-    if not isinstance(prefixes, list):
-        raise ValidationError("'prefixes' must be a list")
-    
+
     # Check max prefixes limit
-    max_prefixes = current_app.config.get('MAX_PREFIXES', 50)
+    max_prefixes = app_config.get('MAX_PREFIXES', 50)
     if len(prefixes) > max_prefixes:
         raise ValidationError(f"Too many prefixes (max: {max_prefixes})")
-    
+
+    # Prefixes are interned for the same reason as ASNs: they key every
+    # RIB and RIB-In dict in the simulator
+    interned_prefixes = []
     for prefix in prefixes:
         if not isinstance(prefix, str):
             raise ValidationError(f"Prefix {prefix} must be a string")
         if not _is_valid_prefix(prefix):
             raise ValidationError(f"Invalid prefix format: {prefix}")
-    
-    config["prefixes"] = prefixes
+        interned_prefixes.append(sys.intern(prefix))
+
+    config["prefixes"] = interned_prefixes
     
     # Validate origin_as
     origin_as = config.get("origin_as", nodes[0])
-    if origin_as not in nodes:
+    if not isinstance(origin_as, str):
+        raise ValidationError(f"origin_as '{origin_as}' must be a string")
+    if origin_as not in nodes_set:
         raise ValidationError(f"origin_as '{origin_as}' not in nodes list")
-    config["origin_as"] = origin_as
+    config["origin_as"] = sys.intern(origin_as)
     
     # Validate scenario
     scenario = config.get("scenario", "baseline")
-    valid_scenarios = ["baseline", "hijack", "route_flap"]
-    if scenario not in valid_scenarios:
-        raise ValidationError(f"Invalid scenario. Must be one of: {valid_scenarios}")
+    if scenario not in _VALID_SCENARIOS:
+        raise ValidationError(f"Invalid scenario. Must be one of: {sorted(_VALID_SCENARIOS)}")
     config["scenario"] = scenario
     
     # Validate hijacker for hijack scenario
@@ -99,8 +159,11 @@ def validate_config(config: dict) -> Dict[str, Any]:
         hijacker = config.get("hijacker")
         if not hijacker:
             raise ValidationError("'hijacker' field required for hijack scenario")
-        if hijacker not in nodes:
+        if not isinstance(hijacker, str):
+            raise ValidationError(f"hijacker '{hijacker}' must be a string")
+        if hijacker not in nodes_set:
             raise ValidationError(f"hijacker '{hijacker}' not in nodes list")
+        config["hijacker"] = sys.intern(hijacker)
     
     # Validate policies
     policies = config.get("policies", {})
@@ -108,7 +171,7 @@ def validate_config(config: dict) -> Dict[str, Any]:
         raise ValidationError("'policies' must be a dictionary")
     
     for asn, policy in policies.items():
-        if asn not in nodes:
+        if asn not in nodes_set:
             raise ValidationError(f"Policy for AS '{asn}' references non-existent node")
         
         if not isinstance(policy, dict):
@@ -121,7 +184,7 @@ def validate_config(config: dict) -> Dict[str, Any]:
                 raise ValidationError(f"local_pref for AS '{asn}' must be a dictionary")
             
             for neighbor, pref in local_pref.items():
-                if neighbor not in nodes:
+                if neighbor not in nodes_set:
                     raise ValidationError(f"local_pref references non-existent neighbor '{neighbor}'")
                 if not isinstance(pref, int) or pref < 0:
                     raise ValidationError(f"local_pref value must be a non-negative integer")
@@ -158,37 +221,63 @@ def validate_config(config: dict) -> Dict[str, Any]:
     return config
 
 
+def _check_structure(config: dict):
+    """
+    Validate configuration structure (fallback when fastjsonschema
+    is not installed)
+
+    Args:
+        config: Configuration dictionary to validate
+
+    Raises:
+        ValidationError: If structure is invalid
+    """
+    # Validate required fields
+    if "nodes" not in config:
+        raise ValidationError("Missing required field: 'nodes'")
+
+    if "links" not in config:
+        raise ValidationError("Missing required field: 'links'")
+
+    # Validate nodes (element types are checked in validate_config's
+    # fused pass)
+    nodes = config["nodes"]
+    if not isinstance(nodes, list) or len(nodes) == 0:
+        raise ValidationError("'nodes' must be a non-empty list")
+
+    # Validate links
+    links = config["links"]
+    if not isinstance(links, list):
+        raise ValidationError("'links' must be a list")
+
+    for link in links:
+        if not isinstance(link, list) or len(link) != 2:
+            raise ValidationError(f"Link {link} must be a list of 2 elements")
+
+    # Validate prefixes (element types are checked in validate_config's
+    # fused pass)
+    prefixes = config.get("prefixes", [])
+    if not isinstance(prefixes, list):
+        raise ValidationError("'prefixes' must be a list")
+
+
+# Validates octet ranges (0-255) and mask (0-32) in a single C-level scan
+_PREFIX_RE = re.compile(
+    r'^(25[0-5]|2[0-4]\d|[01]?\d\d?)'
+    r'(\.(25[0-5]|2[0-4]\d|[01]?\d\d?)){3}'
+    r'/(3[0-2]|[12]?\d)$'
+)
+
+
+@lru_cache(maxsize=1024)
 def _is_valid_prefix(prefix: str) -> bool:
     """
     Validate IP prefix format
-    
+
     Args:
         prefix: IP prefix string
-        
+
     Returns:
         True if valid, False otherwise
     """
-    try:
-        if '/' not in prefix:
-            return False
-        
-        ip_part, mask_part = prefix.split('/')
-        
-        # Validate mask
-        mask = int(mask_part)
-        if mask < 0 or mask > 32:
-            return False
-        
-        # Validate IP address
-        octets = ip_part.split('.')
-        if len(octets) != 4:
-            return False
-        
-        for octet in octets:
-            num = int(octet)
-            if num < 0 or num > 255:
-                return False
-        
-        return True
-    except (ValueError, AttributeError):
-        return False
+    return _PREFIX_RE.match(prefix) is not None
@@ -802,7 +802,7 @@ function displayTimelineForStep(step) {
                     </span>
                     <div class="flex-1">
                         <div class="text-sm font-medium">
-                            Step ${s + 1}: AS${event.from_as}
+                            Step ${s + 1}${event.from_as ? `: AS${event.from_as}` : ''}
                             ${event.to_as ? `→ AS${event.to_as}` : ''}
                         </div>
                         ${event.prefix ? `<div class="text-xs mt-1" style="color: var(--muted);">Prefix: ${event.prefix}</div>` : ''}
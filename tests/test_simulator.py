@@ -10,8 +10,10 @@ import os
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from app import create_app
 from app.models import Route, OriginType, ASNode, Policy
-from app.utils import BGPSimulator, run_simulation
+from app.utils import BGPSimulator, run_simulation, run_batch
+from app.utils.validators import validate_config, ValidationError
 
 
 class TestRoute:
@@ -25,7 +27,7 @@ class TestRoute:
             origin=OriginType.IGP
         )
         assert route.prefix == "10.0.1.0/24"
-        assert route.as_path == ["100", "200"]
+        assert route.as_path == ("100", "200")
         assert route.origin == OriginType.IGP
     
     def test_loop_detection(self):
@@ -46,11 +48,11 @@ class TestRoute:
             as_path=["100", "200"],
             local_pref=150
         )
-        
+
         cloned = route.clone()
-        cloned.as_path.append("300")
-        
-        # Original should be unchanged
+        cloned.as_path = cloned.as_path + ("300",)
+
+        # The path is an immutable tuple, so the original is unchanged
         assert len(route.as_path) == 2
         assert len(cloned.as_path) == 3
 
@@ -192,8 +194,7 @@ class TestPolicy:
     
     def test_export_policy_deny_filter(self):
         """Test export policy filters"""
-        policy = Policy()
-        policy.export_filters = [["deny", "10.0.1.0/24"]]
+        policy = Policy({"export_filters": [["deny", "10.0.1.0/24"]]})
         
         route = Route(
             prefix="10.0.1.0/24",
@@ -218,6 +219,60 @@ class TestPolicy:
         assert len(result.as_path) == 4  # 2 prepended + 2 original
 
 
+class TestValidateConfig:
+    """Configuration validation tests"""
+
+    def _validate(self, config):
+        app = create_app()
+        with app.app_context():
+            return validate_config(config)
+
+    def test_non_string_link_endpoint_rejected(self):
+        """Test links with non-string endpoints raise ValidationError"""
+        config = {
+            "nodes": ["100", "200"],
+            "links": [[["100"], "200"]]
+        }
+
+        with pytest.raises(ValidationError):
+            self._validate(config)
+
+    def test_non_string_origin_as_rejected(self):
+        """Test non-string origin_as raises ValidationError"""
+        config = {
+            "nodes": ["100", "200"],
+            "links": [["100", "200"]],
+            "origin_as": ["100"]
+        }
+
+        with pytest.raises(ValidationError):
+            self._validate(config)
+
+    def test_non_string_hijacker_rejected(self):
+        """Test non-string hijacker raises ValidationError"""
+        config = {
+            "nodes": ["100", "200"],
+            "links": [["100", "200"]],
+            "scenario": "hijack",
+            "hijacker": {"asn": "200"}
+        }
+
+        with pytest.raises(ValidationError):
+            self._validate(config)
+
+    def test_invalid_config_returns_400(self):
+        """Test /api/validate rejects a bad link endpoint with a 400"""
+        app = create_app()
+        config = {
+            "nodes": ["100", "200"],
+            "links": [[["100"], "200"]]
+        }
+
+        response = app.test_client().post('/api/validate', json=config)
+        assert response.status_code == 400
+        assert response.get_json()["valid"] is False
+
+
 class TestBGPSimulator:
     """BGP simulator integration tests"""
     
@@ -286,6 +341,26 @@ class TestBGPSimulator:
         assert "10.0.1.0/24" in results["final_ribs"]["300"]
         assert "10.0.2.0/24" in results["final_ribs"]["300"]
 
+    def test_run_batch(self):
+        """Test parallel batch runs match individual runs, in input order"""
+        configs = [
+            {
+                "nodes": ["100", "200", "300"],
+                "links": [["100", "200"], ["200", "300"]],
+                "prefixes": ["10.0.1.0/24"],
+                "origin_as": "100",
+                "scenario": scenario,
+                **extra
+            }
+            for scenario, extra in [("baseline", {}), ("hijack", {"hijacker": "300"})]
+        ]
+
+        results = run_batch(configs, workers=2)
+
+        assert len(results) == len(configs)
+        for config, result in zip(configs, results):
+            assert result == run_simulation(config)
+
 
 class TestEventTimeline:
     """Event timeline tests"""
@@ -308,6 +383,24 @@ class TestEventTimeline:
         assert "open" in event_types
         assert "update" in event_types
 
+    def test_record_timeline_disabled(self):
+        """Test that record_timeline: false skips the timeline but keeps metrics"""
+        config = {
+            "nodes": ["100", "200", "300"],
+            "links": [["100", "200"], ["200", "300"]],
+            "prefixes": ["10.0.1.0/24"],
+            "origin_as": "100",
+            "scenario": "baseline"
+        }
+
+        baseline = run_simulation(config)
+        silent = run_simulation({**config, "record_timeline": False})
+
+        # No events recorded, but counters still match the full run
+        assert silent["timeline"] == []
+        assert silent["metrics"]["total_updates"] == baseline["metrics"]["total_updates"]
+        assert silent["metrics"]["total_events"] == baseline["metrics"]["total_events"]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])